@@ -4,12 +4,111 @@ Herald v0.1 - Hunger & Movement Demo
 You are the LLM! Give Herald commands or let him roam.
 """
 
+import io
 import time
 import random
 import os
 import sys
 import select
-from datetime import datetime
+import atexit
+import fcntl
+import termios
+import tty
+from bisect import bisect_right
+from collections import deque
+
+# Optional acceleration: with numpy + numba installed, the vision scan
+# runs as compiled code over a uint8 mirror of the food mask
+try:
+    import numpy as np
+except ImportError:
+    np = None
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Block-buffer stdout: on a TTY it is line-buffered, so every print is
+# its own write syscall. Buffered, a whole frame goes out in one write
+# when we flush. input() still flushes before showing its prompt.
+if hasattr(sys.stdout, "buffer"):
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8",
+                                  line_buffering=False, write_through=False)
+
+# ANSI: home the cursor and clear the screen (no fork like os.system('clear'))
+CLEAR = "\x1b[H\x1b[2J"
+
+MAX_VISION = 4  # largest vision range anyone uses
+
+# Vision offsets grouped into Manhattan-distance rings (diamonds), so a
+# scan can walk outward ring by ring and stop at the first food it finds
+_RINGS = []
+for _d in range(MAX_VISION + 1):
+    _ring = []
+    for _dx in range(-_d, _d + 1):
+        _rem = _d - abs(_dx)
+        _ring.append((_dx, _rem))
+        if _rem:
+            _ring.append((_dx, -_rem))
+    _RINGS.append(tuple(_ring))
+del _d, _dx, _rem, _ring
+
+# Direction name -> (dx, dy) delta
+DIRS = {"north": (0, -1), "south": (0, 1), "east": (1, 0), "west": (-1, 0)}
+
+# The command text never changes, so build it once instead of per frame
+_COMMAND_SUMMARY = " | ".join(["move <dir>", "eat", "wait", "status", "step",
+                               "auto (x to stop)", "stop", "reset", "help", "quit"])
+
+_HELP_COMMANDS = (
+    "  move <direction>  - Move north/south/east/west",
+    "  eat               - Eat food if present",
+    "  wait              - Do nothing this turn",
+    "  status            - Show Herald's current state",
+    "  auto              - Let Herald roam on his own",
+    "  stop              - Stop auto mode",
+    "  help              - Show this help",
+    "  quit              - Exit game",
+)
+_HELP_TEXT = "\nCOMMANDS:\n" + "\n".join(f"    {cmd}" for cmd in _HELP_COMMANDS) + "\n\n"
+
+# Timestamp cache: the HH:MM:SS string only changes once per second,
+# so only reformat when the wall-clock second rolls over
+_last_sec = -1
+_last_str = ""
+
+if np is not None and njit is not None:
+    @njit(cache=True)
+    def _nearest_food(grid, x, y, vision_range):
+        """Nearest food by Manhattan distance, or (-1, -1, -1) if none"""
+        height, width = grid.shape
+        best_x, best_y, best_d = -1, -1, vision_range + 1
+        for dy in range(-vision_range, vision_range + 1):
+            check_y = y + dy
+            if check_y < 0 or check_y >= height:
+                continue
+            for dx in range(-vision_range, vision_range + 1):
+                check_x = x + dx
+                if check_x < 0 or check_x >= width:
+                    continue
+                if grid[check_y, check_x]:
+                    distance = abs(dx) + abs(dy)
+                    if distance < best_d:
+                        best_x, best_y, best_d = check_x, check_y, distance
+        if best_x < 0:
+            return -1, -1, -1
+        return best_x, best_y, best_d
+else:
+    _nearest_food = None
+
+
+def _now_hms():
+    global _last_sec, _last_str
+    s = int(time.time())
+    if s != _last_sec:
+        _last_sec = s
+        _last_str = time.strftime("%H:%M:%S", time.localtime(s))
+    return _last_str
 
 class World:
     """The game world - a simple grid with food spawning"""
@@ -17,24 +116,48 @@ class World:
     def __init__(self, width=5, height=5):
         self.width = width
         self.height = height
-        self.food_locations = set()
+        # Food lives in one big int: bit (y * width + x) is set when the
+        # cell has food, so every query is a shift-and-mask instead of a
+        # set lookup
+        self.food_mask = 0
+        self._dirty = True  # something changed since the last draw
+        # Mirror of food_mask for the numba kernel (None without numpy)
+        self.food_grid = np.zeros((height, width), dtype=np.uint8) if np is not None else None
+        # Per-cell mask of every in-range cell, so "any food in sight?" is
+        # a single AND against food_mask
+        self._radius_masks = {}
+        for y in range(height):
+            for x in range(width):
+                mask = 0
+                for ring in _RINGS:
+                    for dx, dy in ring:
+                        if self.is_valid_position(x + dx, y + dy):
+                            mask |= 1 << ((y + dy) * width + (x + dx))
+                self._radius_masks[(x, y)] = mask
         self.spawn_initial_food()
 
     
     def spawn_initial_food(self):
-        """Put some food in random locations"""
-        for _ in range(8):
-            x = random.randint(0, self.width - 1)
-            y = random.randint(0, self.height - 1)
-            self.food_locations.add((x, y))
-    
+        """Put food in 8 distinct random locations"""
+        # sample() can't repeat cells, so we always get exactly 8 food tiles
+        for cell in random.sample(range(self.width * self.height), 8):
+            self.food_mask |= 1 << cell
+            if self.food_grid is not None:
+                y, x = divmod(cell, self.width)
+                self.food_grid[y, x] = 1
+
     def has_food_at(self, x, y):
         """Check if there's food at this location"""
-        return (x, y) in self.food_locations
-    
+        if not self.is_valid_position(x, y):
+            return False
+        return bool((self.food_mask >> (y * self.width + x)) & 1)
+
     def remove_food_at(self, x, y):
         """Remove food after it's eaten"""
-        self.food_locations.discard((x, y))
+        if self.is_valid_position(x, y):
+            self.food_mask &= ~(1 << (y * self.width + x))
+            if self.food_grid is not None:
+                self.food_grid[y, x] = 0
     
     def is_valid_position(self, x, y):
         """Check if coordinates are within world bounds"""
@@ -43,7 +166,11 @@ class World:
 
 class Herald:
     """Herald - our NPC who gets hungry and needs to eat"""
-    
+
+    # Hunger buckets: label i applies below threshold i
+    _HUNGER_THRESHOLDS = (20, 40, 60, 80)
+    _HUNGER_LABELS = ("Full", "Satisfied", "Getting hungry", "Very hungry", "STARVING")
+
     def __init__(self, world, x=2, y=2):        
         self.world = world
         self.x = x
@@ -51,38 +178,34 @@ class Herald:
         self.hunger = 0  # 0 = full, 100 = starving
         self.hunger_rate = 5  # Hunger increases by this each tick
         self.alive = True
-        self.actions_taken = []
+        self.debug = False  # set True to see move_toward reasoning
+        self.actions_taken = deque(maxlen=20)  # memory limit
         
     def tick(self):
         """Called each game tick - hunger increases over time"""
-        if self.alive:
-            self.hunger += self.hunger_rate
-            if self.hunger >= 100:
-                self.hunger = 100
-                self.alive = False
-                self.log_action("DIED", "Herald starved to death!")
+        if not self.alive:
+            return
+        hunger = self.hunger + self.hunger_rate
+        if hunger >= 100:
+            self.hunger = 100
+            self.alive = False
+            self.log_action("DIED", "Herald starved to death!")
+        else:
+            self.hunger = hunger
+        self.world._dirty = True
     
     def move(self, direction):
         """Move in a direction: north, south, east, west"""
-        old_x, old_y = self.x, self.y
-        
-        if direction == "north":
-            self.y -= 1
-        elif direction == "south":
-            self.y += 1
-        elif direction == "east":
-            self.x += 1
-        elif direction == "west":
-            self.x -= 1
-        else:
+        delta = DIRS.get(direction)
+        if delta is None:
             return False, "Invalid direction"
-        
-        # Check if move is valid
-        if not self.world.is_valid_position(self.x, self.y):
-            # Move back if out of bounds
-            self.x, self.y = old_x, old_y
+
+        new_x, new_y = self.x + delta[0], self.y + delta[1]
+        if not self.world.is_valid_position(new_x, new_y):
             return False, "Can't move there - out of bounds"
-        
+
+        self.x, self.y = new_x, new_y
+        self.world._dirty = True
         self.log_action("MOVE", f"Moved {direction} to ({self.x}, {self.y})")
         return True, f"Moved {direction}"
     
@@ -90,6 +213,7 @@ class Herald:
         """Eat food if present at current location"""
         if self.world.has_food_at(self.x, self.y):
             self.world.remove_food_at(self.x, self.y)
+            self.world._dirty = True
             self.hunger = max(0, self.hunger - 50)  # Eating reduces hunger
             self.log_action("EAT", f"Ate food at ({self.x}, {self.y}). Hunger now: {self.hunger}")
             return True, "Ate food! Yum!"
@@ -110,97 +234,65 @@ class Herald:
     
     def get_hunger_description(self):
         """Human-readable hunger level"""
-        if self.hunger < 20:
-            return "Full"
-        elif self.hunger < 40:
-            return "Satisfied"
-        elif self.hunger < 60:
-            return "Getting hungry"
-        elif self.hunger < 80:
-            return "Very hungry"
-        else:
-            return "STARVING"
-        
+        return self._HUNGER_LABELS[bisect_right(self._HUNGER_THRESHOLDS, self.hunger)]
 
-    def look_around(self, vision_range= 4):
-        """Look around for food within vision range"""
-        nearest_food = None
-        nearest_distance = float('inf')
 
-        for dx in range(-vision_range, vision_range + 1):
-            for dy in range(-vision_range, vision_range + 1):
+    def look_around(self, vision_range=MAX_VISION):
+        """Look around for food within vision range (nearest first)"""
+        # Fast path: one AND tells us if any food is in sight at all
+        if not self.world.food_mask & self.world._radius_masks[(self.x, self.y)]:
+            return None
+        if _nearest_food is not None:
+            fx, fy, _ = _nearest_food(self.world.food_grid, self.x, self.y, vision_range)
+            return None if fx < 0 else (fx, fy)
+        # Walk outward ring by ring: the first hit is guaranteed nearest,
+        # and only rings up to the first non-empty one are ever visited
+        for ring in _RINGS[:vision_range + 1]:
+            for dx, dy in ring:
                 check_x = self.x + dx
                 check_y = self.y + dy
-
-                if not self.world.is_valid_position(check_x, check_y):
-                    continue
-
-                if self.world.has_food_at(check_x, check_y):
-                    distance = abs(dx) + abs(dy)
-
-                    if distance < nearest_distance:
-                            nearest_distance = distance
-                            nearest_food = (check_x, check_y)
-        return nearest_food
+                if self.world.is_valid_position(check_x, check_y) \
+                        and self.world.has_food_at(check_x, check_y):
+                    return (check_x, check_y)
+        return None
     
     def move_toward(self, target_x, target_y):
         """move one stop toward target location"""
         dx = target_x - self.x
         dy = target_y - self.y
 
-        print(f"[DEBUG move_toward] Target: ({target_x}, {target_y}), Current: ({self.x}, {self.y}), dx={dx}, dy={dy}")
-    
+        if self.debug:
+            print(f"[DEBUG move_toward] Target: ({target_x}, {target_y}), Current: ({self.x}, {self.y}), dx={dx}, dy={dy}")
+
         # If already at target
         if dx == 0 and dy == 0:
-            print("[DEBUG] Already at target!")
+            if self.debug:
+                print("[DEBUG] Already at target!")
             return False, "Already here"
-        
-        if abs(dx) > abs(dy):
-        # Move horizontally
-            if dx > 0:
-                print("[DEBUG] Moving east")
-                return self.move("east")
-            else:
-                print("[DEBUG] Moving west")
-                return self.move("west")
-        elif abs(dy) > abs(dx):
-            # Move vertically
-            if dy > 0:
-                print("[DEBUG] Moving south")
-                return self.move("south")
-            else:
-                print("[DEBUG] Moving north")
-                return self.move("north")
+
+        # Close the bigger gap first; prefer horizontal on ties
+        if abs(dx) >= abs(dy) and dx != 0:
+            direction = "east" if dx > 0 else "west"
         else:
-            # Equal distance - choose randomly or prefer one direction
-            if dx != 0:
-                if dx > 0:
-                    print("[DEBUG] Moving east (equal distance)")
-                    return self.move("east")
-                else:
-                    print("[DEBUG] Moving west (equal distance)")
-                    return self.move("west")
-            elif dy != 0:
-                if dy > 0:
-                    print("[DEBUG] Moving south (equal distance)")
-                    return self.move("south")
-                else:
-                    print("[DEBUG] Moving north (equal distance)")
-                    return self.move("north")
+            direction = "south" if dy > 0 else "north"
+
+        if self.debug:
+            print(f"[DEBUG] Moving {direction}")
+        return self.move(direction)
     
-    def log_action(self, action_type, description):
+    def log_action(self, action_type, description, status=None):
         """Log what Herald does (for future LLM context)"""
+        if status is None:
+            # Cheap snapshot - no has_food_at lookup or hunger formatting,
+            # the full get_status() dict was never read back anyway
+            status = {"hunger": self.hunger, "xy": (self.x, self.y), "alive": self.alive}
         entry = {
-            "timestamp": datetime.now().strftime("%H:%M:%S"),
+            "timestamp": _now_hms(),
             "type": action_type,
             "description": description,
-            "state": self.get_status()
+            "state": status
         }
-        self.actions_taken.append(entry)
-        
-        # Keep only last 20 actions (memory limit)
-        if len(self.actions_taken) > 20:
-            self.actions_taken.pop(0)
+        self.actions_taken.append(entry)  # deque drops the oldest for us
 
 
 class Game:
@@ -210,10 +302,31 @@ class Game:
         self.running = True
         self.auto_mode = False
         self.step_mode = False
+        self.target_fps = 2  # auto-mode ticks per second
+        self.frame_budget = 1.0 / self.target_fps
         self.tick_count = 0
         self.world = None
         self.herald = None
 
+        # Saved terminal state while auto mode has the TTY in cbreak mode
+        self._old_term = None
+        self._old_flags = None
+        atexit.register(self._exit_cbreak)
+
+        # Command dispatch table: one dict lookup instead of an elif ladder
+        self._cmds = {
+            "move": self._cmd_move,
+            "eat": self._cmd_eat,
+            "wait": self._cmd_wait,
+            "status": self._cmd_status,
+            "auto": self._cmd_auto,
+            "step": self._cmd_step,
+            "stop": self._cmd_stop,
+            "reset": self._cmd_reset,
+            "help": self._cmd_help,
+            "quit": self._cmd_quit,
+        }
+
         self.reset_world(show_message=False)
 
     def reset_world(self, show_message=True):
@@ -226,131 +339,150 @@ class Game:
         if show_message:
             print("→ World reset! Herald lives again!")
 
-    def check_for_stop_command(self):
-        """Check if user pressed a key without blocking"""    
-        if select.select([sys.stdin], [], [], 0)[0]:
+    def _enter_cbreak(self):
+        """Put the TTY in cbreak + non-blocking mode so auto mode can poll
+        for a bare 'x' keypress with a single read, no select, no Enter"""
+        if self._old_term is not None or not sys.stdin.isatty():
+            return
+        self._old_term = termios.tcgetattr(0)
+        tty.setcbreak(0)
+        self._old_flags = fcntl.fcntl(0, fcntl.F_GETFL)
+        fcntl.fcntl(0, fcntl.F_SETFL, self._old_flags | os.O_NONBLOCK)
+
+    def _exit_cbreak(self):
+        """Restore the terminal for normal line-based input()"""
+        if self._old_term is None:
+            return
+        fcntl.fcntl(0, fcntl.F_SETFL, self._old_flags)
+        termios.tcsetattr(0, termios.TCSADRAIN, self._old_term)
+        self._old_term = None
+
+    def check_for_stop_command(self, timeout=0.0):
+        """Check if user pressed a key, waiting at most `timeout` seconds"""
+        if self._old_term is not None:
+            # cbreak mode: sleep off the wait, then drain whatever was typed
+            if timeout > 0:
+                time.sleep(timeout)
+            try:
+                keys = os.read(0, 8)
+            except BlockingIOError:
+                return False
+            return b'x' in keys.lower()
+        # Fallback when stdin is not a TTY: the old select poll
+        if select.select([sys.stdin], [], [], timeout)[0]:
             key = sys.stdin.readline().strip()
             if key.lower() == 'x':
                 return True
         return False
     
-    def draw_world(self):
-        """Display the world grid"""
-        
-        os.system('clear')
-        print("\nCOMMANDS: {self.get_command_summary()}")
-        print("\n" + "="*70)
-        print(f"TICK {self.tick_count} | Herald's World")
-        print("="*70)
-        
-        # Draw grid
+    def draw_world(self, force=False):
+        """Display the world grid (skipped when nothing changed)"""
+        if not self.world._dirty and not force:
+            return
+        self.world._dirty = False
+
+        # Build the whole frame in memory, then write it in one go
+        buf = [CLEAR]
+        buf.append(f"\nCOMMANDS: {self.get_command_summary()}\n")
+        buf.append("\n" + "="*70 + "\n")
+        buf.append(f"TICK {self.tick_count} | Herald's World\n")
+        buf.append("="*70 + "\n")
+
+        # Draw grid - one join per row instead of growing a string cell by cell
+        herald_x, herald_y = self.herald.x, self.herald.y
+        has_food_at = self.world.has_food_at
         for y in range(self.world.height):
-            row = ""
-            for x in range(self.world.width):
-                if self.herald.x == x and self.herald.y == y:
-                    row += " H "  # Herald
-                elif self.world.has_food_at(x, y):
-                    row += " F "  # Food
-                else:
-                    row += " . "  # Empty
-            print(row)
-        
-        print()
-        
+            buf.append("".join(
+                " H " if x == herald_x and y == herald_y  # Herald
+                else " F " if has_food_at(x, y)           # Food
+                else " . "                                # Empty
+                for x in range(self.world.width)))
+            buf.append("\n")
+
+        buf.append("\n")
+
         # Show status
         status = self.herald.get_status()
-        print(f"Status: {status['status']}")
-        print(f"Location: {status['location']}")
-        print(f"Hunger: {status['hunger']}/100 ({status['hunger_desc']})")
-        print(f"Food here: {'YES' if status['sees_food'] else 'NO'}")
-        print()
+        buf.append(f"Status: {status['status']}\n")
+        buf.append(f"Location: {status['location']}\n")
+        buf.append(f"Hunger: {status['hunger']}/100 ({status['hunger_desc']})\n")
+        buf.append(f"Food here: {'YES' if status['sees_food'] else 'NO'}\n")
+        buf.append("\n")
+
+        sys.stdout.write("".join(buf))
+        sys.stdout.flush()
     
     def show_help(self):
         """Display available commands"""
-        commands = [
-            "  move <direction>  - Move north/south/east/west"
-            "  eat               - Eat food if present"
-            "  wait              - Do nothing this turn"
-            "  status            - Show Herald's current state"
-            "  auto              - Let Herald roam on his own"
-            "  stop              - Stop auto mode"
-            "  help              - Show this help"
-            "  quit              - Exit game"
-        ]
-
-        print("\nCOMMANDS:")
-        for cmd in commands:
-            print(f"    {cmd}")
-        print()
+        sys.stdout.write(_HELP_TEXT)
+        return list(_HELP_COMMANDS)
 
-        return commands
-    
     def get_command_summary(self):
         """Get a one line summary of commands"""
-        commands = ["move <dir>", "eat", "wait", "status", "step", "auto (x to stop)", "stop", "reset", "help", "quit"]
-        return " | ".join(commands)             
+        return _COMMAND_SUMMARY
     
     def process_command(self, command):
         """Execute a command"""
         parts = command.lower().strip().split()
-        
+
         if not parts:
             return
-        
-        cmd = parts[0]
-        
-        if cmd == "move":
-            if len(parts) < 2:
-                print("Usage: move <north/south/east/west>")
-                return
-            
-            direction = parts[1]
-            success, message = self.herald.move(direction)
-            print(f"→ {message}")
-            
-            # Check for food after moving
-            if success and self.world.has_food_at(self.herald.x, self.herald.y):
-                print(f"→ Herald sees food here!")
-        
-        elif cmd == "eat":
-            success, message = self.herald.eat()
-            print(f"→ {message}")
-        
-        elif cmd == "wait":
-            self.herald.log_action("WAIT", "Herald waited")
-            print("→ Herald does nothing this turn")
-        
-        elif cmd == "status":
-            self.show_detailed_status()
-        
-        elif cmd == "auto":
-            self.auto_mode = True
-            print("→ AUTO MODE: Herald will decide on his own")
-            print("  (Type 'stop' to take back control)")
-
-        elif cmd == "step":
-            self.step_mode = True
-            print("→ STEP MODE: Herald will move one tick at a time")
-            print("  Press Enter to advance, or 'stop' to exit step mode")
-        
-        elif cmd == "stop":
-            self.auto_mode = False
-            self.step_mode = False
-            print("→ Manual control resumed")
-        
-        elif cmd == "reset":
-            self.reset_world()
-        
-        elif cmd == "help":
-            self.show_help()
-        
-        elif cmd == "quit":
-            self.running = False
-            print("→ Goodbye!")
-        
-        else:
-            print(f"Unknown command: {cmd}")
+
+        handler = self._cmds.get(parts[0])
+        if handler is None:
+            print(f"Unknown command: {parts[0]}")
             print("Type 'help' for commands")
+            return
+        handler(parts)
+
+    def _cmd_move(self, parts):
+        if len(parts) < 2:
+            print("Usage: move <north/south/east/west>")
+            return
+
+        direction = parts[1]
+        success, message = self.herald.move(direction)
+        print(f"→ {message}")
+
+        # Check for food after moving
+        if success and self.world.has_food_at(self.herald.x, self.herald.y):
+            print(f"→ Herald sees food here!")
+
+    def _cmd_eat(self, parts):
+        success, message = self.herald.eat()
+        print(f"→ {message}")
+
+    def _cmd_wait(self, parts):
+        self.herald.log_action("WAIT", "Herald waited")
+        print("→ Herald does nothing this turn")
+
+    def _cmd_status(self, parts):
+        self.show_detailed_status()
+
+    def _cmd_auto(self, parts):
+        self.auto_mode = True
+        print("→ AUTO MODE: Herald will decide on his own")
+        print("  (Type 'stop' to take back control)")
+
+    def _cmd_step(self, parts):
+        self.step_mode = True
+        print("→ STEP MODE: Herald will move one tick at a time")
+        print("  Press Enter to advance, or 'stop' to exit step mode")
+
+    def _cmd_stop(self, parts):
+        self.auto_mode = False
+        self.step_mode = False
+        print("→ Manual control resumed")
+
+    def _cmd_reset(self, parts):
+        self.reset_world()
+
+    def _cmd_help(self, parts):
+        self.show_help()
+
+    def _cmd_quit(self, parts):
+        self.running = False
+        print("→ Goodbye!")
     
     def show_detailed_status(self):
         """Show full Herald info"""
@@ -362,7 +494,7 @@ class Game:
         print(f"Food at location: {status['sees_food']}")
         
         print("\nRecent actions:")
-        for action in self.herald.actions_taken[-5:]:
+        for action in list(self.herald.actions_taken)[-5:]:
             print(f"  [{action['timestamp']}] {action['description']}")
         print()
 
@@ -374,13 +506,19 @@ class Game:
         print("\nAll food on map:")
 
         food_list = []
-        for x in range(self.world.width):
-            for y in range(self.world.height):
-                if self.world.has_food_at(x, y):
-                    distance = abs(x - self.herald.x) + abs(y - self.herald.y)
-                    food_list.append((x, y, distance))
-
-        food_list.sort(key=lambda f: f[2])
+        if np is not None:
+            # One vectorized pass: distances to every food cell at once
+            ys, xs = np.nonzero(self.world.food_grid)
+            dists = np.abs(xs - self.herald.x) + np.abs(ys - self.herald.y)
+            for i in np.argsort(dists, kind="stable"):
+                food_list.append((int(xs[i]), int(ys[i]), int(dists[i])))
+        else:
+            for x in range(self.world.width):
+                for y in range(self.world.height):
+                    if self.world.has_food_at(x, y):
+                        distance = abs(x - self.herald.x) + abs(y - self.herald.y)
+                        food_list.append((x, y, distance))
+            food_list.sort(key=lambda f: f[2])
 
         for food_x, food_y, distance in food_list:
             visible = "✓ VISIBLE" if distance <= 4 else "x out of range" 
@@ -400,7 +538,8 @@ class Game:
         """
         status = self.herald.get_status()
 
-        print(f"[DEBUG] Hunger: {status['hunger']}, Food here: {status['sees_food']}")
+        if self.herald.debug:
+            print(f"[DEBUG] Hunger: {status['hunger']}, Food here: {status['sees_food']}")
         
         # Rule 1: If food here and hungry, eat
         if status['sees_food'] and status['hunger'] > 30:
@@ -441,42 +580,62 @@ class Game:
         print("Type 'help' for commands, 'auto' to watch him roam.")
         
         self.show_help()
-        
-        while self.running and self.herald.alive:
-            self.draw_world()
-            
+
+        # Hoist the per-tick lookups out of the loop. reset_world rebinds
+        # self.herald, so herald/tick must be refreshed whenever that happens
+        # (see the check after command handling below).
+        perf_counter = time.perf_counter
+        draw = self.draw_world
+        decide = self.herald_auto_decide
+        check_stop = self.check_for_stop_command
+        herald = self.herald
+        tick = herald.tick
+
+        while self.running and herald.alive:
+            t0 = perf_counter()
+            draw()
+
             if self.auto_mode:
-                print("[AUTO MODE - Herald deciding...(press x + Enter to stop)]")
-                if self.check_for_stop_command():
+                self._enter_cbreak()
+                print("[AUTO MODE - Herald deciding...(press x to stop)]")
+                decide()
+                sys.stdout.flush()  # show Herald's thoughts before the pause
+                # Sleep off the rest of the frame budget, which doubles as
+                # the window for a stop keypress
+                remaining = self.frame_budget - (perf_counter() - t0)
+                if check_stop(max(0.0, remaining)):
                     self.auto_mode = False
+                    self._exit_cbreak()
                     print("→ Manual control resumed")
-                else:
-                    self.herald_auto_decide()
-                    time.sleep(1)  # Pause so user can watch
             elif self.step_mode:
                 print("\n[STEP MODE - Press Enter to advance, 'stop' to exit]")
                 self.show_vision_debug()
-    
+
                 command = input(">>> ").strip().lower()
                 if command == "stop":
                     self.step_mode = False
                     print("→ Manual control resumed")
                 else:
                     # Advance one step
-                    self.herald_auto_decide()
+                    decide()
 
-        
             else:
                 command = input("Your command (or 'help'): ")
                 self.process_command(command)
-            
+
+            # A 'reset' command may have swapped Herald out - re-cache
+            if herald is not self.herald:
+                herald = self.herald
+                tick = herald.tick
+
             # End of turn - hunger increases
-            self.herald.tick()
+            tick()
             self.tick_count += 1
-            
+
             # Check if Herald died
-            if not self.herald.alive:
-                self.draw_world()
+            if not herald.alive:
+                self._exit_cbreak()  # back to line input for the prompt below
+                draw(force=True)
                 print("\n💀 HERALD HAS DIED OF STARVATION 💀")
                 print(f"He survived {self.tick_count} ticks.")
 
@@ -484,12 +643,15 @@ class Game:
 
                 if choice in ['yes', 'y;']:
                     self.reset_world()
+                    herald = self.herald
+                    tick = herald.tick
                     continue
                 else:
                     break
                 
         
         print("\nGame Over!")
+        sys.stdout.flush()
 
 
 # Initialize the world and Herald